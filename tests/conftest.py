@@ -1,10 +1,41 @@
+import json
 import os
 import time
 import docker
 import pytest
 import subprocess
+import threading
+from collections import deque
 from pathlib import Path
-from typing import Generator, Dict, Any
+from typing import Generator, Dict, Any, Iterable, List, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; JSON helpers fall back to the standard library
+    orjson = None
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # watchdog is optional; waits fall back to polling
+    FileSystemEventHandler = object
+    Observer = None
+
+
+def json_loads(data: Union[bytes, memoryview, str]) -> Any:
+    """Decode JSON with orjson when available; accepts bytes without a UTF-8 decode step."""
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def json_dumps_pretty(obj: Any) -> str:
+    """Encode JSON with a two-space indent."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(obj, indent=2)
 
 
 @pytest.fixture(scope="session")
@@ -25,33 +56,179 @@ def clients_dir(test_root_dir: Path) -> Path:
     return test_root_dir / "sandbox"
 
 
+class ContainerLogWatcher:
+    """Follow a container's logs in a background thread and signal registered markers.
+
+    Each line is checked against the markers registered so far as it arrives. Only
+    the most recent HISTORY_LINES lines are kept for markers registered later; once
+    older lines have been dropped, a new marker missing from the kept lines is
+    looked up with a one-off `docker logs` read instead.
+    """
+
+    HISTORY_LINES = 5000
+
+    def __init__(self, container_name: str):
+        self.container_name = container_name
+        self._lock = threading.Lock()
+        self._lines: deque = deque(maxlen=self.HISTORY_LINES)
+        self._truncated = False
+        self._markers: Dict[str, threading.Event] = {}
+        # No --tail: replay the full history so markers logged before the first wait still match
+        self._process = subprocess.Popen(
+            ["docker", "logs", "-f", container_name],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            errors="replace",
+        )
+        self._thread = threading.Thread(target=self._follow, daemon=True)
+        self._thread.start()
+
+    def _follow(self) -> None:
+        for line in self._process.stdout:
+            with self._lock:
+                if len(self._lines) == self.HISTORY_LINES:
+                    self._truncated = True
+                self._lines.append(line)
+                for marker, event in self._markers.items():
+                    if not event.is_set() and marker in line:
+                        event.set()
+
+    def is_alive(self) -> bool:
+        return self._thread.is_alive()
+
+    def register(self, marker: str) -> threading.Event:
+        """Return an event that is set once `marker` appears in the container logs."""
+        with self._lock:
+            event = self._markers.get(marker)
+            if event is not None:
+                return event
+            # From here on the follower checks new lines for the marker, so only the
+            # history up to this point has to be scanned, outside the lock
+            event = threading.Event()
+            self._markers[marker] = event
+            history = list(self._lines)
+            truncated = self._truncated
+
+        if any(marker in line for line in history) or (truncated and self._in_full_logs(marker)):
+            event.set()
+        return event
+
+    def _in_full_logs(self, marker: str) -> bool:
+        result = subprocess.run(
+            ["docker", "logs", self.container_name],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+        )
+        return marker.encode() in result.stdout
+
+    def stop(self) -> None:
+        self._process.terminate()
+        self._process.wait()
+
+
+_log_watchers: Dict[str, ContainerLogWatcher] = {}
+_log_watchers_lock = threading.Lock()
+
+
+def get_log_watcher(container_name: str) -> ContainerLogWatcher:
+    """Get the shared log watcher for a container, (re)attaching if it is not following."""
+    with _log_watchers_lock:
+        watcher = _log_watchers.get(container_name)
+        # `docker logs -f` exits when the container stops or does not exist yet
+        if watcher is None or not watcher.is_alive():
+            watcher = ContainerLogWatcher(container_name)
+            _log_watchers[container_name] = watcher
+        return watcher
+
+
+@pytest.fixture(scope="session", autouse=True)
+def container_log_watchers() -> Generator[Dict[str, ContainerLogWatcher], None, None]:
+    """Stop all background `docker logs -f` followers at the end of the session."""
+    yield _log_watchers
+    with _log_watchers_lock:
+        for watcher in _log_watchers.values():
+            watcher.stop()
+        _log_watchers.clear()
+
+
 def wait_for_container_log(container_name: str, expected_text: str, timeout: int = 60) -> bool:
     """Wait for specific text to appear in container logs."""
-    start_time = time.time()
-    while time.time() - start_time < timeout:
+    deadline = time.time() + timeout
+    while True:
+        remaining = deadline - time.time()
         try:
-            result = subprocess.run(
-                ["docker", "logs", container_name],
-                capture_output=True,
-                text=True,
-                check=False
-            )
-            if expected_text in result.stdout or expected_text in result.stderr:
-                return True
+            event = get_log_watcher(container_name).register(expected_text)
         except Exception:
-            pass
-        time.sleep(1)
-    return False
+            event = None
+        if event is not None and event.wait(timeout=min(max(remaining, 0), 1)):
+            return True
+        if remaining <= 0:
+            return False
+        if event is None:
+            time.sleep(min(remaining, 1))
+
+
+class PathCreatedHandler(FileSystemEventHandler):
+    """Set an event once a watched path exists, re-checked on every filesystem event."""
+
+    def __init__(self, path: Path, created: threading.Event):
+        super().__init__()
+        self.path = path
+        self.created = created
+
+    def on_any_event(self, event) -> None:
+        if self.path.exists():
+            self.created.set()
+
+
+def wait_for_path(path: Path, watch_dir: Path, timeout: float = 30) -> bool:
+    """Wait for `path` to exist, waking on filesystem events under `watch_dir`.
+
+    Uses inotify/FSEvents through watchdog when it is installed. A one second
+    re-check backs up the observer (and replaces it when watchdog is missing),
+    since events are not delivered for every kind of mount.
+    """
+    if path.exists():
+        return True
+
+    created = threading.Event()
+    observer = None
+    if Observer is not None and watch_dir.is_dir():
+        observer = Observer()
+        observer.schedule(PathCreatedHandler(path, created), str(watch_dir), recursive=True)
+        observer.start()
+
+    try:
+        deadline = time.time() + timeout
+        while not path.exists():
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                return False
+            created.wait(min(remaining, 1))
+        return True
+    finally:
+        if observer is not None:
+            observer.stop()
+            observer.join()
 
 
 def wait_for_file(file_path: Path, timeout: int = 30) -> bool:
     """Wait for a file to exist."""
-    start_time = time.time()
-    while time.time() - start_time < timeout:
-        if file_path.exists():
-            return True
-        time.sleep(1)
-    return False
+    # Watch the closest directory that already exists; new subdirectories are picked up recursively
+    watch_dir = file_path.parent
+    while not watch_dir.exists() and watch_dir != watch_dir.parent:
+        watch_dir = watch_dir.parent
+    return wait_for_path(file_path, watch_dir, timeout=timeout)
+
+
+def wait_for_all(paths: Iterable[Path], timeout: int = 30) -> bool:
+    """Wait for every path in `paths` to exist, sharing one deadline across them."""
+    deadline = time.time() + timeout
+    for path in paths:
+        if not wait_for_file(path, timeout=max(deadline - time.time(), 0)):
+            return False
+    return True
 
 
 def get_container_status(docker_client: docker.DockerClient, container_name: str) -> Dict[str, Any]:
@@ -67,6 +244,22 @@ def get_container_status(docker_client: docker.DockerClient, container_name: str
         return {"status": "not_found", "running": False, "logs": ""}
 
 
+def get_container_statuses(docker_client: docker.DockerClient, container_names: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Get status information for several containers with a single Docker API call.
+
+    Uses the low-level list endpoint: `containers.list()` would inspect every match separately.
+    """
+    statuses = {name: {"status": "not_found", "running": False} for name in container_names}
+    # The name filter matches substrings, so only exact names are taken from the results
+    for container in docker_client.api.containers(all=True, filters={"name": container_names}):
+        state = container.get("State", "")
+        for name in container.get("Names") or []:
+            name = name.lstrip("/")
+            if name in statuses:
+                statuses[name] = {"status": state, "running": state == "running"}
+    return statuses
+
+
 @pytest.fixture
 def cleanup_containers(docker_client: docker.DockerClient) -> Generator[None, None, None]:
     """Cleanup containers after test."""
@@ -40,8 +40,10 @@ class TestFileSync:
         ), f"Bob failed to connect. Logs: {get_container_status(docker_client, bob_container)['logs']}"
         print(f"✓ Bob ({self.CLIENT2_EMAIL}) connected")
         
-        # Step 4: Give clients time to initialize their directory structures
-        time.sleep(5)
+        # Step 4: Wait for clients to initialize their directory structures
+        for client_email in [self.CLIENT1_EMAIL, self.CLIENT2_EMAIL]:
+            datasites_dir = clients_dir / client_email / "SyftBox" / "datasites"
+            assert wait_for_file(datasites_dir, timeout=30), f"{client_email} did not initialize {datasites_dir}"
         
         # Debug: Show actual directory structure
         print(f"🔍 Checking directory structure...")
@@ -115,7 +117,7 @@ class TestMultipleFileSync:
     CLIENT1_EMAIL = "alice@syftbox.net"
     CLIENT2_EMAIL = "bob@syftbox.net"
     
-    def test_multiple_files_sync(self, docker_client, clients_dir):
+    def test_multiple_files_sync(self, clients_dir):
         """Test that multiple files sync correctly."""
         
         # Wait for both clients to be connected
@@ -125,8 +127,10 @@ class TestMultipleFileSync:
         assert wait_for_container_log(alice_container, "socketmgr client connected", timeout=30)
         assert wait_for_container_log(bob_container, "socketmgr client connected", timeout=30)
         
-        # Give time for initialization
-        time.sleep(5)
+        # Wait for initialization
+        for client_email in [self.CLIENT1_EMAIL, self.CLIENT2_EMAIL]:
+            datasites_dir = clients_dir / client_email / "SyftBox" / "datasites"
+            assert wait_for_file(datasites_dir, timeout=30), f"{client_email} did not initialize {datasites_dir}"
         
         # Write multiple files
         alice_public_dir = clients_dir / self.CLIENT1_EMAIL / "SyftBox" / "datasites" / self.CLIENT1_EMAIL / "public"
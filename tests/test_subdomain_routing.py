@@ -63,7 +63,8 @@ class SubdomainTestHelper:
                     "-c",
                     "which curl || apk add curl",
                 ],
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
             )
 
             # Build the hosts entries - resolve server hostnames to IP
@@ -477,7 +478,7 @@ class TestHashSubdomains:
 class TestVanityDomains:
     """Test vanity domain configuration and routing."""
 
-    def test_vanity_domain_with_settings_yaml(self, docker_client, clients_dir):
+    def test_vanity_domain_with_settings_yaml(self, clients_dir):
         """Test custom vanity domain configuration via settings.yaml."""
         helper = SubdomainTestHelper()
 
@@ -556,7 +557,7 @@ class TestVanityDomains:
 
         print("✅ Vanity domain settings.yaml test passed!")
 
-    def test_multiple_vanity_domains(self, docker_client, clients_dir):
+    def test_multiple_vanity_domains(self, clients_dir):
         """Test multiple custom vanity domains for the same user."""
         helper = SubdomainTestHelper()
 
@@ -717,7 +718,7 @@ class TestSubdomainSecurity:
 
         print("✅ ACL enforcement test passed!")
 
-    def test_cross_user_access_blocking(self, docker_client, clients_dir):
+    def test_cross_user_access_blocking(self, clients_dir):
         """Test that users cannot access each other's private content via subdomains."""
         helper = SubdomainTestHelper()
 
@@ -780,7 +781,7 @@ class TestSubdomainSecurity:
 class TestSubdomain404Responses:
     """Test that subdomain routing returns proper 404 responses."""
 
-    def test_nonexistent_file_returns_404(self, docker_client, clients_dir):
+    def test_nonexistent_file_returns_404(self, clients_dir):
         """Test that requesting a non-existent file returns 404."""
         helper = SubdomainTestHelper()
 
@@ -816,7 +817,7 @@ class TestSubdomain404Responses:
 
         print("✅ Non-existent file correctly returns 404!")
 
-    def test_subdomain_without_settings_returns_404(self, docker_client, clients_dir):
+    def test_subdomain_without_settings_returns_404(self, clients_dir):
         """Test that hash subdomain without settings.yaml configuration returns 404."""
         helper = SubdomainTestHelper()
 
@@ -850,7 +851,7 @@ class TestSubdomain404Responses:
 
         print("✅ Subdomain without settings correctly returns 404!")
 
-    def test_private_file_access_returns_404_or_403(self, docker_client, clients_dir):
+    def test_private_file_access_returns_404_or_403(self, clients_dir):
         """Test that accessing private files returns 404 or 403."""
         helper = SubdomainTestHelper()
 
@@ -917,7 +918,7 @@ class TestSubdomain404Responses:
 class TestSubdomainEdgeCases:
     """Test edge cases and error handling for subdomain routing."""
 
-    def test_unknown_subdomain_handling(self, docker_client, clients_dir):
+    def test_unknown_subdomain_handling(self, clients_dir):
         """Test that unknown subdomains return 500."""
         helper = SubdomainTestHelper()
 
@@ -948,7 +949,7 @@ class TestSubdomainEdgeCases:
 
         print("✅ Unknown subdomain handling test passed!")
 
-    def test_api_endpoint_passthrough(self, docker_client, clients_dir):
+    def test_api_endpoint_passthrough(self, clients_dir):
         """Test that API endpoints on subdomains pass through correctly."""
         helper = SubdomainTestHelper()
 
@@ -978,9 +979,7 @@ class TestSubdomainEdgeCases:
 class TestSubdomainIntegration:
     """End-to-end integration tests for subdomain functionality."""
 
-    def test_file_upload_to_subdomain_availability_flow(
-        self, docker_client, clients_dir
-    ):
+    def test_file_upload_to_subdomain_availability_flow(self, clients_dir):
         """Test the complete flow: file upload → immediate subdomain availability."""
         helper = SubdomainTestHelper()
 
@@ -1030,7 +1029,7 @@ class TestSubdomainIntegration:
         assert file_available, "File not available via subdomain within expected time"
         print("✅ File upload to subdomain availability flow test passed!")
 
-    def test_settings_change_hot_reload(self, docker_client, clients_dir):
+    def test_settings_change_hot_reload(self, clients_dir):
         """Test that settings.yaml changes are applied immediately."""
         helper = SubdomainTestHelper()
 
@@ -1,18 +1,31 @@
-import json
+import hashlib
+import os
 import shutil
+import struct
 import subprocess
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, List
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
 
 import pytest
 
+try:
+    import fcntl
+except ImportError:  # Windows has no flock; builds there are not serialized
+    fcntl = None
+
 from tests.conftest import (
-    get_container_status,
+    get_container_statuses,
+    json_dumps_pretty,
+    json_loads,
+    wait_for_all,
     wait_for_container_log,
     wait_for_file,
+    wait_for_path,
 )
 
 
@@ -48,15 +61,54 @@ def syc_repo_root(test_root_dir: Path) -> Path:
     return repo
 
 
-@pytest.fixture(scope="session")
-def syc_binary(syc_repo_root: Path) -> Path:
-    """Compile the syc CLI from the submodule and return the binary path."""
-    binary_name = "syc.exe" if sys.platform == "win32" else "syc"
-    binary_path = syc_repo_root / "target" / "debug" / binary_name
+SYC_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "syft-repoverse" / "syc"
+
+
+def source_tree_digest(root: Path) -> Optional[str]:
+    """Hash the paths and contents of every non-ignored file in a git checkout.
 
+    Returns None when the files cannot be listed (no git, not a checkout, or git
+    refusing the directory), since no partial hash can stand in for the sources.
+    """
+    try:
+        listing = subprocess.run(
+            ["git", "ls-files", "-z", "--cached", "--others", "--exclude-standard"],
+            cwd=root,
+            capture_output=True,
+        )
+    except OSError:
+        return None
+    if listing.returncode != 0:
+        return None
+    relative_paths = sorted(path for path in listing.stdout.decode("utf-8").split("\0") if path)
+
+    digest = hashlib.blake2b(digest_size=16)
+    for relative_path in relative_paths:
+        file_path = root / relative_path
+        if not file_path.is_file():
+            continue
+        digest.update(relative_path.encode("utf-8") + b"\0")
+        with file_path.open("rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+@contextmanager
+def exclusive_lock(lock_path: Path) -> Iterator[None]:
+    """Hold an exclusive advisory lock on `lock_path` (a no-op where fcntl is unavailable)."""
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with lock_path.open("w") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        yield
+
+
+def build_syc_binary(syc_repo_root: Path, binary_path: Path) -> None:
     build_cmd = [
         "cargo",
         "build",
+        "--release",
         "--manifest-path",
         str(syc_repo_root / "cli" / "Cargo.toml"),
         "--bin",
@@ -77,7 +129,36 @@ def syc_binary(syc_repo_root: Path) -> Path:
             f"stderr:\n{result.stderr}"
         )
 
-    return binary_path
+
+@pytest.fixture(scope="session")
+def syc_binary(syc_repo_root: Path) -> Path:
+    """Compile the syc CLI (release profile) from the submodule and return the binary path.
+
+    Builds are cached under SYC_CACHE_DIR keyed by a hash of the submodule's
+    sources, so later sessions with the same sources skip cargo entirely.
+    Concurrent sessions serialize on a lock file and reuse the first build.
+    If the sources cannot be hashed the cache is bypassed and cargo always runs.
+    """
+    binary_name = "syc.exe" if sys.platform == "win32" else "syc"
+    binary_path = syc_repo_root / "target" / "release" / binary_name
+    digest = source_tree_digest(syc_repo_root)
+    if digest is None:
+        build_syc_binary(syc_repo_root, binary_path)
+        return binary_path
+
+    cached_path = SYC_CACHE_DIR / digest / binary_name
+    if cached_path.exists():
+        return cached_path
+
+    with exclusive_lock(SYC_CACHE_DIR / f"{digest}.lock"):
+        if not cached_path.exists():
+            build_syc_binary(syc_repo_root, binary_path)
+            cached_path.parent.mkdir(parents=True, exist_ok=True)
+            staging_path = cached_path.with_name(f"{binary_name}.tmp")
+            shutil.copy2(binary_path, staging_path)
+            staging_path.replace(cached_path)
+
+    return cached_path
 
 
 @pytest.fixture
@@ -107,7 +188,7 @@ def syc_clients(clients_dir: Path) -> List[SyCClientEnv]:
             "encrypted_root": "../SyftBox/datasites",
             "shadow_root": "../SyftBox/unencrypted",
         }
-        config_path.write_text(json.dumps(config, indent=2))
+        config_path.write_text(json_dumps_pretty(config))
 
         clients.append(env)
 
@@ -128,9 +209,9 @@ def run_syc_command(syc_binary: Path) -> SycCommand:
             *args,
         ]
 
+        # Output stays as bytes; it is only decoded when a failure needs to be reported
         result = subprocess.run(
             cmd,
-            text=True,
             capture_output=True,
         )
 
@@ -138,8 +219,8 @@ def run_syc_command(syc_binary: Path) -> SycCommand:
             pytest.fail(
                 f"syc command failed for {client.email}:\n"
                 f"$ {' '.join(cmd)}\n"
-                f"stdout:\n{result.stdout}\n"
-                f"stderr:\n{result.stderr}"
+                f"stdout:\n{result.stdout.decode('utf-8', errors='replace')}\n"
+                f"stderr:\n{result.stderr.decode('utf-8', errors='replace')}"
             )
 
         return result
@@ -148,13 +229,9 @@ def run_syc_command(syc_binary: Path) -> SycCommand:
 
 
 def wait_for_syftbox_structure(client: SyCClientEnv, timeout: int = 45) -> None:
-    syftbox_dir = client.base_dir / "SyftBox"
-    start = time.time()
-    while time.time() - start < timeout:
-        if syftbox_dir.exists() and (syftbox_dir / "datasites").exists():
-            return
-        time.sleep(1)
-    pytest.fail(f"SyftBox directory did not initialize for {client.email}")
+    datasites_dir = client.base_dir / "SyftBox" / "datasites"
+    if not wait_for_path(datasites_dir, client.base_dir, timeout=timeout):
+        pytest.fail(f"SyftBox directory did not initialize for {client.email}")
 
 
 def write_shared_acl(owner: SyCClientEnv, readers: Iterable[str]) -> None:
@@ -180,18 +257,28 @@ def write_shared_acl(owner: SyCClientEnv, readers: Iterable[str]) -> None:
     acl_path.write_text(f"{acl_body}\n")
 
 
+def run_in_parallel(fn: Callable[[Any], Any], items: List[Any]) -> List[Any]:
+    """Run `fn` over `items` in threads, re-raising the first failure (e.g. pytest.fail)."""
+    with ThreadPoolExecutor(max_workers=len(items)) as executor:
+        futures = [executor.submit(fn, item) for item in items]
+        for future in as_completed(futures):
+            future.result()
+    return [future.result() for future in futures]
+
+
 def parse_envelope_blob(blob: bytes) -> Dict[str, Any]:
     assert blob.startswith(b"SYC1"), "Missing SYC1 envelope header"
     if len(blob) < 9:
         raise ValueError("Envelope truncated before prelude length")
-    version = blob[4]
-    prelude_len = int.from_bytes(blob[5:9], "little")
+    # Work on a memoryview so the prelude JSON is parsed without copying it out of the blob
+    view = memoryview(blob)
+    version = view[4]
+    (prelude_len,) = struct.unpack_from("<I", view, 5)
     prelude_start = 9
     prelude_end = prelude_start + prelude_len
-    if prelude_end > len(blob):
+    if prelude_end > len(view):
         raise ValueError("Envelope prelude exceeds blob length")
-    prelude_bytes = blob[prelude_start:prelude_end]
-    prelude = json.loads(prelude_bytes.decode("utf-8"))
+    prelude = json_loads(view[prelude_start:prelude_end])
 
     recipients = [
         entry.get("identity")
@@ -221,17 +308,20 @@ class TestSyftCryptoCLI:
         run_syc_command: SycCommand,
     ) -> None:
         # Ensure server and clients are online
-        server_status = get_container_status(docker_client, "syftbox-server")
-        assert server_status["running"], "SyftBox server must be running for syc tests"
+        statuses = get_container_statuses(
+            docker_client, ["syftbox-server", *(client.container for client in syc_clients)]
+        )
+        assert statuses["syftbox-server"]["running"], "SyftBox server must be running for syc tests"
 
         for client in syc_clients:
+            assert statuses[client.container]["running"], f"{client.email} container is not running"
             assert wait_for_container_log(client.container, "socketmgr client connected", timeout=45), (
                 f"{client.email} failed to connect to the server"
             )
             wait_for_syftbox_structure(client)
 
         # Generate key material for each client and export their bundles
-        for client in syc_clients:
+        def generate_keys(client: SyCClientEnv) -> None:
             bundle_relative = Path(client.email) / "public" / "crypto" / "did.json"
             run_syc_command(
                 client,
@@ -249,29 +339,28 @@ class TestSyftCryptoCLI:
             key_file = client.vault / "keys" / f"{client.email}.key"
             assert key_file.exists(), f"Expected key file for {client.email} at {key_file}"
             assert client.public_bundle_path.exists(), f"Public bundle not found for {client.email}"
-            key_doc = json.loads(key_file.read_text())
+            key_doc = json_loads(key_file.read_bytes())
             assert key_doc.get("identity") == client.email, "Key file identity mismatch"
 
-        # Allow SyftBox sync to propagate exported bundles across clients
-        time.sleep(10)
+        run_in_parallel(generate_keys, syc_clients)
 
         # Everyone should receive everyone else's bundles
-        for source_client in syc_clients:
-            bundle_relative = Path(source_client.email) / "public" / "crypto" / "did.json"
-            for target_client in syc_clients:
-                expected_path = target_client.data_root / bundle_relative
-                if not wait_for_file(expected_path, timeout=120):
-                    pytest.fail(
-                        f"{target_client.email} did not receive bundle from {source_client.email} "
-                        f"at {expected_path}"
-                    )
-
-        # Import public bundles to establish TOFU entries in each vault
-        for source_client in syc_clients:
-            bundle_relative = Path(source_client.email) / "public" / "crypto" / "did.json"
-            for target_client in syc_clients:
+        expected_bundles = [
+            target_client.data_root / source_client.email / "public" / "crypto" / "did.json"
+            for source_client in syc_clients
+            for target_client in syc_clients
+        ]
+        if not wait_for_all(expected_bundles, timeout=120):
+            missing = "\n".join(str(path) for path in expected_bundles if not path.exists())
+            pytest.fail(f"Public bundles did not propagate to all clients:\n{missing}")
+
+        # Import public bundles to establish TOFU entries in each vault. Vaults are
+        # imported into concurrently, but each vault's imports run one at a time.
+        def import_bundles(target_client: SyCClientEnv) -> None:
+            for source_client in syc_clients:
                 if target_client.email == source_client.email:
                     continue
+                bundle_relative = Path(source_client.email) / "public" / "crypto" / "did.json"
                 run_syc_command(
                     target_client,
                     [
@@ -284,13 +373,15 @@ class TestSyftCryptoCLI:
                     ],
                 )
 
+        run_in_parallel(import_bundles, syc_clients)
+
         alice = next(client for client in syc_clients if client.email.startswith("alice"))
         bob = next(client for client in syc_clients if client.email.startswith("bob"))
         charlie = next(client for client in syc_clients if client.email.startswith("charlie"))
 
-        # Allow Bob to read Alice's shared space via ACL
+        # Allow Bob to read Alice's shared space via ACL. Propagation is covered by the
+        # wait for Bob's ciphertext below.
         write_shared_acl(alice, [bob.email])
-        time.sleep(5)
 
         # Encrypt a file from Alice to Bob
         alice_plain_path = alice.shadow_root / self.RELATIVE_SHARED
@@ -334,10 +425,11 @@ class TestSyftCryptoCLI:
             ],
         )
         inspect_output = inspect_result.stdout + inspect_result.stderr
-        assert "envelope magic: SYC1" in inspect_output
-        assert f"sender: {alice.email}" in inspect_output
+        assert b"envelope magic: SYC1" in inspect_output
+        assert f"sender: {alice.email}".encode("utf-8") in inspect_output
 
         charlie_cipher_path = charlie.data_root / self.RELATIVE_SHARED
+        # Negative check: give sync a grace period to (wrongly) deliver the share
         time.sleep(5)
         assert not charlie_cipher_path.exists(), "Charlie should not receive Bob-only share"
 
@@ -380,7 +472,6 @@ class TestSyftCryptoCLI:
 
         # Expand ACL to include Charlie as a reader and confirm the share arrives but remains undecryptable
         write_shared_acl(alice, [bob.email, charlie.email])
-        time.sleep(5)
 
         assert wait_for_file(charlie_cipher_path, timeout=60), "Charlie did not receive direct share after ACL update"
         charlie_direct_bytes = charlie_cipher_path.read_bytes()
@@ -402,7 +493,7 @@ class TestSyftCryptoCLI:
             ],
         )
         inspect_after_acl_output = inspect_after_acl.stdout + inspect_after_acl.stderr
-        assert "envelope magic: SYC1" in inspect_after_acl_output
+        assert b"envelope magic: SYC1" in inspect_after_acl_output
 
         second_attempt = run_syc_command(
             charlie,
@@ -3,35 +3,162 @@ Test to verify access logs are correctly written after other tests have run.
 This test should run after the main integration tests to verify logging functionality.
 """
 
-import json
+import os
 import subprocess
-import time
+import threading
+from collections import Counter
+from contextlib import closing
 from datetime import datetime
-from pathlib import Path
-from typing import Dict, List, Optional
+from itertools import pairwise
+from typing import Dict, Generator, Iterable, Iterator, List, Optional, Tuple
 
 import pytest
-import docker
+import fastjsonschema
+
+from tests.conftest import json_dumps_pretty, json_loads
+
+
+VALID_ACCESS_TYPES = frozenset({"read", "write", "admin", "deny"})
+VALID_METHODS = frozenset({"GET", "POST", "PUT", "DELETE", "HEAD", "OPTIONS", "PATCH"})
+
+LOG_ENTRY_PROPERTIES = {
+    "timestamp": {"type": "string", "pattern": " (UTC|GMT)$"},
+    "path": {"type": "string"},
+    "access_type": {"type": "string", "enum": sorted(VALID_ACCESS_TYPES)},
+    "user": {"type": "string"},
+    "ip": {"type": "string"},
+    "user_agent": {"type": "string"},
+    "method": {"type": "string", "enum": sorted(VALID_METHODS)},
+    "status_code": {"type": "integer", "minimum": 100, "maximum": 599},
+    "allowed": {"type": "boolean"},
+}
+
+# Draft 4 keeps "integer" strict: later drafts would also accept 200.0 as a status code
+LOG_ENTRY_SCHEMA = {
+    "$schema": "http://json-schema.org/draft-04/schema#",
+    "type": "object",
+    "required": list(LOG_ENTRY_PROPERTIES),
+    "properties": LOG_ENTRY_PROPERTIES,
+}
+
+# Compiled once into a straight-line validator function
+validate_log_entry = fastjsonschema.compile(LOG_ENTRY_SCHEMA)
 
 
 class AccessLogVerifier:
     """Helper class for verifying access log structure and content."""
     
+    __slots__ = ()
+    
     EXPECTED_CLIENTS = ["alice@syftbox.net", "bob@syftbox.net"]
     CONTAINER_NAME = "syftbox-server"
     LOG_BASE_PATH = "/root/.logs/access"
     
-    @staticmethod
-    def get_docker_client() -> docker.DockerClient:
-        """Get Docker client instance."""
-        return docker.from_env()
+    # A single `docker exec -i ... sh` session shared by every command, so each
+    # call costs a pipe round-trip instead of a new exec through the daemon
+    SHELL_SENTINEL = "__ACCESS_LOG_VERIFIER_END__"
+    _shell: Optional[subprocess.Popen] = None
+    _shell_lock = threading.Lock()
+    # Thread currently holding _shell_lock through _stream_command, to reject re-entry
+    _shell_owner: Optional[int] = None
     
-    @staticmethod
-    def exec_in_container(command: str) -> tuple[bool, str]:
-        """Execute a command in the server container and return success status and output."""
-        cmd = ["docker", "exec", AccessLogVerifier.CONTAINER_NAME, "sh", "-c", command]
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        return result.returncode == 0, result.stdout
+    # Parsed log entries keyed by (email, filename), filled by prefetch_today_logs()
+    _log_cache: Dict[Tuple[str, str], List[Dict]] = {}
+    # get_log_statistics() results keyed by (email, filename), see log_file_statistics()
+    _stats_cache: Dict[Tuple[str, str], Dict] = {}
+    # list_log_files() results keyed by email
+    _files_cache: Dict[str, List[str]] = {}
+    
+    @classmethod
+    def _get_shell(cls) -> subprocess.Popen:
+        """Return the shared shell, starting a new one if needed. Caller must hold _shell_lock."""
+        if cls._shell is None or cls._shell.poll() is not None:
+            cls._shell = subprocess.Popen(
+                ["docker", "exec", "-i", cls.CONTAINER_NAME, "sh"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        return cls._shell
+    
+    @classmethod
+    def _close_shell(cls) -> None:
+        """Shut down the shared shell, if one is running."""
+        with cls._shell_lock:
+            shell, cls._shell = cls._shell, None
+        if shell is not None and shell.poll() is None:
+            shell.stdin.close()
+            try:
+                shell.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                shell.kill()
+    
+    @classmethod
+    def _stream_command(cls, command: str) -> Generator[bytes, None, int]:
+        """Yield a command's raw output lines from the shared shell as they arrive.
+        
+        Returns the command's exit status, or -1 if the shell died. The shell is held
+        until the generator finishes, so no other command may run from this thread in
+        the meantime; closing it early drains the remaining output.
+        """
+        sentinel = cls.SHELL_SENTINEL.encode()
+        # The lock is held across yields, so a command issued from the same thread while
+        # a stream is open would wait on itself forever; fail loudly instead
+        if cls._shell_owner == threading.get_ident():
+            raise RuntimeError("The shared container shell is busy with an open stream; exhaust or close it first")
+        with cls._shell_lock:
+            cls._shell_owner = threading.get_ident()
+            try:
+                shell = cls._get_shell()
+                try:
+                    # Run in a subshell so the command cannot change the session's state. The
+                    # leading newline keeps the sentinel on its own line.
+                    shell.stdin.write(f"( {command}\n)\nprintf '\\n{cls.SHELL_SENTINEL}%d\\n' $?\n".encode())
+                    shell.stdin.flush()
+                except OSError:
+                    cls._shell = None
+                    return -1
+                
+                finished = False
+                try:
+                    while True:
+                        line = shell.stdout.readline()
+                        if not line:
+                            # The shell exited, e.g. the container is not running
+                            finished = True
+                            shell.wait()
+                            cls._shell = None
+                            return -1
+                        if line.startswith(sentinel):
+                            finished = True
+                            return int(line[len(sentinel):])
+                        yield line
+                finally:
+                    if not finished:
+                        for line in iter(shell.stdout.readline, b""):
+                            if line.startswith(sentinel):
+                                break
+            finally:
+                cls._shell_owner = None
+    
+    @classmethod
+    def exec_in_container(cls, command: str) -> tuple[bool, bytes]:
+        """Execute a command in the server container and return success status and raw output.
+        
+        Output is left undecoded so log contents can go straight to the JSON parser.
+        """
+        lines = []
+        stream = cls._stream_command(command)
+        try:
+            while True:
+                lines.append(next(stream))
+        except StopIteration as stop:
+            returncode = stop.value
+        
+        if returncode < 0:
+            return False, b""
+        # Drop the newline printed ahead of the sentinel
+        return returncode == 0, b"".join(lines)[:-1]
     
     @staticmethod
     def list_log_directories() -> List[str]:
@@ -39,123 +166,189 @@ class AccessLogVerifier:
         success, output = AccessLogVerifier.exec_in_container(
             f"ls -1 {AccessLogVerifier.LOG_BASE_PATH}/ 2>/dev/null || echo 'NO_LOGS_DIR'"
         )
-        if not success or "NO_LOGS_DIR" in output:
+        if not success or b"NO_LOGS_DIR" in output:
             return []
-        return [line.strip() for line in output.strip().split('\n') if line.strip()]
+        return [line.strip().decode("utf-8", "replace") for line in output.strip().split(b'\n') if line.strip()]
     
-    @staticmethod
-    def list_log_files(email: str) -> List[str]:
+    @classmethod
+    def list_log_files(cls, email: str) -> List[str]:
         """List all log files for a specific email."""
-        log_dir = f"{AccessLogVerifier.LOG_BASE_PATH}/{email}"
-        success, output = AccessLogVerifier.exec_in_container(
+        cached = cls._files_cache.get(email)
+        if cached is not None:
+            return cached
+        
+        log_dir = f"{cls.LOG_BASE_PATH}/{email}"
+        success, output = cls.exec_in_container(
             f"ls -1 {log_dir}/ 2>/dev/null || echo 'NO_FILES'"
         )
-        if not success or "NO_FILES" in output:
+        if not success or b"NO_FILES" in output:
             return []
-        return [line.strip() for line in output.strip().split('\n') if line.strip()]
+        files = cls._files_cache[email] = [
+            line.strip().decode("utf-8", "replace") for line in output.strip().split(b'\n') if line.strip()
+        ]
+        return files
     
     @staticmethod
-    def read_log_file(email: str, filename: str) -> List[Dict]:
+    def iter_lines(buf: bytes) -> Iterator[bytes]:
+        """Yield the lines of `buf` one at a time without building a list of all of them."""
+        start = 0
+        end = len(buf)
+        while start < end:
+            newline = buf.find(b'\n', start)
+            if newline < 0:
+                yield buf[start:]
+                return
+            yield buf[start:newline]
+            start = newline + 1
+    
+    @staticmethod
+    def parse_log_lines(lines: Iterable[bytes]) -> Iterator[Dict]:
+        """Parse newline-delimited JSON log lines one at a time, skipping malformed lines."""
+        for line in lines:
+            if line.strip():
+                try:
+                    yield json_loads(line)
+                except ValueError:  # json.JSONDecodeError and orjson.JSONDecodeError
+                    continue
+    
+    @staticmethod
+    def parse_log_output(output: bytes) -> List[Dict]:
+        """Parse newline-delimited JSON log output, skipping malformed lines."""
+        return list(AccessLogVerifier.parse_log_lines(AccessLogVerifier.iter_lines(output)))
+    
+    @classmethod
+    def log_file_path(cls, email: str, filename: str) -> str:
+        """Path of a log file inside the server container."""
+        return f"{cls.LOG_BASE_PATH}/{email}/{filename}"
+    
+    @classmethod
+    def iter_log_file(cls, email: str, filename: str) -> Iterator[Dict]:
+        """Stream parsed entries of a log file without holding the whole file in memory.
+        
+        The shared shell is busy until the iterator is exhausted or closed, and other
+        verifier calls that need it raise RuntimeError meanwhile.
+        """
+        with closing(cls._stream_command(f"cat {cls.log_file_path(email, filename)} 2>/dev/null")) as lines:
+            yield from cls.parse_log_lines(lines)
+    
+    @classmethod
+    def read_first_line(cls, email: str, filename: str) -> Optional[bytes]:
+        """Read the raw first line of a log file, or None if the file cannot be read."""
+        success, output = cls.exec_in_container(f"head -n 1 {cls.log_file_path(email, filename)}")
+        return output if success else None
+    
+    @classmethod
+    def read_log_file(cls, email: str, filename: str) -> List[Dict]:
         """Read and parse a specific log file."""
-        log_path = f"{AccessLogVerifier.LOG_BASE_PATH}/{email}/{filename}"
-        success, output = AccessLogVerifier.exec_in_container(
-            f"cat {log_path} 2>/dev/null"
+        cached = cls._log_cache.get((email, filename))
+        if cached is not None:
+            return cached
+        return list(cls.iter_log_file(email, filename))
+    
+    @classmethod
+    def prefetch_today_logs(cls, today: str) -> Dict[str, List[Dict]]:
+        """Read every expected client's log for `today` (YYYYMMDD) in one container round-trip and cache it."""
+        filename = f"access_{today}.log"
+        marker = "__ACCESS_LOG_FILE__:"
+        # `echo` after each cat keeps the next marker on its own line
+        command = "; ".join(
+            f"echo '{marker}{email}'; cat {cls.log_file_path(email, filename)} 2>/dev/null; echo"
+            for email in cls.EXPECTED_CLIENTS
         )
-        if not success:
-            return []
+        _, output = cls.exec_in_container(command)
         
-        entries = []
-        for line in output.strip().split('\n'):
-            if line:
-                try:
-                    entry = json.loads(line)
-                    entries.append(entry)
-                except json.JSONDecodeError:
-                    continue
-        return entries
+        logs = {}
+        for section in output.split(marker.encode())[1:]:
+            email, _, body = section.partition(b'\n')
+            email = email.decode("utf-8", "replace")
+            logs[email] = cls.parse_log_output(body)
+            cls._log_cache[(email, filename)] = logs[email]
+        return logs
+    
+    @classmethod
+    def clear_log_cache(cls) -> None:
+        """Forget all cached log file listings, contents and statistics."""
+        cls._log_cache.clear()
+        cls._stats_cache.clear()
+        cls._files_cache.clear()
     
     @staticmethod
     def verify_log_entry_structure(entry: Dict) -> tuple[bool, str]:
         """Verify that a log entry has all required fields with correct types."""
-        required_fields = {
-            "timestamp": str,
-            "path": str,
-            "access_type": str,
-            "user": str,
-            "ip": str,
-            "user_agent": str,
-            "method": str,
-            "status_code": int,
-            "allowed": bool
-        }
-        
-        for field, expected_type in required_fields.items():
-            if field not in entry:
-                return False, f"Missing required field: {field}"
-            
-            if not isinstance(entry[field], expected_type):
-                return False, f"Field {field} has wrong type: expected {expected_type.__name__}, got {type(entry[field]).__name__}"
-        
-        # Verify timestamp format
-        if not (" UTC" in entry["timestamp"] or " GMT" in entry["timestamp"]):
-            return False, f"Timestamp format incorrect: {entry['timestamp']}"
-        
-        # Verify access_type values
-        valid_access_types = ["read", "write", "admin", "deny"]
-        if entry["access_type"] not in valid_access_types:
-            return False, f"Invalid access_type: {entry['access_type']}"
-        
-        # Verify HTTP method
-        valid_methods = ["GET", "POST", "PUT", "DELETE", "HEAD", "OPTIONS", "PATCH"]
-        if entry["method"] not in valid_methods:
-            return False, f"Invalid HTTP method: {entry['method']}"
-        
-        # Verify status code range
-        if not (100 <= entry["status_code"] < 600):
-            return False, f"Invalid status code: {entry['status_code']}"
-        
+        try:
+            validate_log_entry(entry)
+        except fastjsonschema.JsonSchemaValueException as e:
+            return False, e.message
         return True, "Valid"
     
     @staticmethod
-    def get_log_statistics(entries: List[Dict]) -> Dict:
-        """Get statistics about log entries."""
-        stats = {
-            "total_entries": len(entries),
-            "allowed_count": sum(1 for e in entries if e.get("allowed", False)),
-            "denied_count": sum(1 for e in entries if not e.get("allowed", True)),
-            "methods": {},
-            "access_types": {},
-            "status_codes": {},
-            "unique_paths": set(),
-            "unique_ips": set()
-        }
-        
-        for entry in entries:
-            # Count methods
-            method = entry.get("method", "UNKNOWN")
-            stats["methods"][method] = stats["methods"].get(method, 0) + 1
-            
-            # Count access types
-            access_type = entry.get("access_type", "UNKNOWN")
-            stats["access_types"][access_type] = stats["access_types"].get(access_type, 0) + 1
-            
-            # Count status codes
-            status_code = str(entry.get("status_code", 0))
-            stats["status_codes"][status_code] = stats["status_codes"].get(status_code, 0) + 1
-            
-            # Track unique paths and IPs
-            stats["unique_paths"].add(entry.get("path", ""))
-            stats["unique_ips"].add(entry.get("ip", ""))
-        
-        # Convert sets to counts for JSON serialization
-        stats["unique_paths_count"] = len(stats["unique_paths"])
-        stats["unique_ips_count"] = len(stats["unique_ips"])
-        del stats["unique_paths"]
-        del stats["unique_ips"]
+    def get_log_statistics(entries: Iterable[Dict]) -> Dict:
+        """Get statistics about log entries in a single pass, so `entries` may be a stream."""
+        total = allowed = denied = 0
+        methods, access_types, status_codes = Counter(), Counter(), Counter()
+        paths, ips = set(), set()
+        # Bound methods are looked up once; the loop body runs for every log line
+        add_path, add_ip = paths.add, ips.add
+        for e in entries:
+            get = e.get
+            total += 1
+            # Entries without an "allowed" field count as neither allowed nor denied
+            if "allowed" in e:
+                if e["allowed"]:
+                    allowed += 1
+                else:
+                    denied += 1
+            methods[get("method", "UNKNOWN")] += 1
+            access_types[get("access_type", "UNKNOWN")] += 1
+            status_codes[str(get("status_code", 0))] += 1
+            add_path(get("path", ""))
+            add_ip(get("ip", ""))
         
+        # Counters are converted back to plain dicts so printed output stays readable
+        return {
+            "total_entries": total,
+            "allowed_count": allowed,
+            "denied_count": denied,
+            "methods": dict(methods),
+            "access_types": dict(access_types),
+            "status_codes": dict(status_codes),
+            "unique_paths_count": len(paths),
+            "unique_ips_count": len(ips),
+        }
+    
+    @classmethod
+    def log_file_statistics(cls, email: str, filename: str) -> Dict:
+        """Get statistics for a log file, computed once and shared between tests."""
+        key = (email, filename)
+        stats = cls._stats_cache.get(key)
+        if stats is None:
+            stats = cls._stats_cache[key] = cls.get_log_statistics(cls.read_log_file(email, filename))
         return stats
 
 
+@pytest.fixture(scope="session")
+def today() -> str:
+    """Date of today's log files (YYYYMMDD), fixed once so a run across midnight stays consistent."""
+    return datetime.now().strftime("%Y%m%d")
+
+
+@pytest.fixture(scope="module", autouse=True)
+def prefetched_logs(today: str) -> Generator[Dict[str, List[Dict]], None, None]:
+    """Fetch and parse today's logs for all clients once for the whole module.
+    
+    Teardown also stops the shared `docker exec` shell the verifier opened.
+    """
+    yield AccessLogVerifier.prefetch_today_logs(today)
+    AccessLogVerifier.clear_log_cache()
+    AccessLogVerifier._close_shell()
+
+
+@pytest.fixture(params=AccessLogVerifier.EXPECTED_CLIENTS)
+def email(request) -> str:
+    """Email of each expected client, so per-client checks pass or fail independently."""
+    return request.param
+
+
 class TestAccessLoggingVerification:
     """Test suite to verify access logs after integration tests have run."""
     
@@ -174,207 +367,199 @@ class TestAccessLoggingVerification:
         
         print(f"✓ All expected client directories found: {AccessLogVerifier.EXPECTED_CLIENTS}")
     
-    def test_log_files_created_with_date(self):
+    def test_log_files_created_with_date(self, email: str, today: str):
         """Test that log files are created with proper date format."""
         verifier = AccessLogVerifier()
-        today = datetime.now().strftime("%Y%m%d")
         
-        for email in AccessLogVerifier.EXPECTED_CLIENTS:
-            print(f"\nChecking log files for {email}...")
-            files = verifier.list_log_files(email)
-            
-            assert len(files) > 0, f"No log files found for {email}"
-            
-            # Check for today's log file
-            expected_filename = f"access_{today}.log"
-            assert expected_filename in files, f"Today's log file ({expected_filename}) not found for {email}"
-            
-            print(f"✓ Found log files for {email}: {files}")
+        print(f"\nChecking log files for {email}...")
+        files = verifier.list_log_files(email)
+        
+        assert len(files) > 0, f"No log files found for {email}"
+        
+        # Check for today's log file
+        expected_filename = f"access_{today}.log"
+        assert expected_filename in files, f"Today's log file ({expected_filename}) not found for {email}"
+        
+        print(f"✓ Found log files for {email}: {files}")
     
-    def test_log_entries_valid_structure(self):
+    def test_log_entries_valid_structure(self, email: str, today: str):
         """Test that all log entries have valid structure and required fields."""
         verifier = AccessLogVerifier()
-        today = datetime.now().strftime("%Y%m%d")
         
-        for email in AccessLogVerifier.EXPECTED_CLIENTS:
-            print(f"\nValidating log entries for {email}...")
-            
-            filename = f"access_{today}.log"
-            entries = verifier.read_log_file(email, filename)
-            
-            assert len(entries) > 0, f"No log entries found for {email}"
-            
-            # Validate each entry
-            invalid_entries = []
-            for i, entry in enumerate(entries):
-                valid, message = verifier.verify_log_entry_structure(entry)
-                if not valid:
-                    invalid_entries.append((i, message, entry))
-            
-            if invalid_entries:
-                for idx, msg, entry in invalid_entries[:3]:  # Show first 3 invalid entries
-                    print(f"  Invalid entry {idx}: {msg}")
-                    print(f"  Entry: {json.dumps(entry, indent=2)}")
-                
-                assert False, f"Found {len(invalid_entries)} invalid entries for {email}"
-            
-            print(f"✓ All {len(entries)} entries valid for {email}")
+        print(f"\nValidating log entries for {email}...")
+        
+        filename = f"access_{today}.log"
+        entries = verifier.read_log_file(email, filename)
+        
+        assert len(entries) > 0, f"No log entries found for {email}"
+        
+        # Validate each entry, stopping once there are enough failures to report
+        max_reported = 3
+        invalid_entries = []
+        for i, entry in enumerate(entries):
+            valid, message = verifier.verify_log_entry_structure(entry)
+            if not valid:
+                invalid_entries.append((i, message, entry))
+                if len(invalid_entries) >= max_reported:
+                    break
+        
+        if invalid_entries:
+            for idx, msg, entry in invalid_entries:
+                print(f"  Invalid entry {idx}: {msg}")
+                # Entries can be large; dump them only when asked to
+                if os.environ.get("VERBOSE_LOG_DUMP"):
+                    print(f"  Entry: {json_dumps_pretty(entry)}")
+            
+            count = len(invalid_entries)
+            found = f"at least {count}" if count >= max_reported else str(count)
+            assert False, f"Found {found} invalid entries for {email}"
+        
+        print(f"✓ All {len(entries)} entries valid for {email}")
     
-    def test_log_entries_match_user(self):
+    def test_log_entries_match_user(self, email: str, today: str):
         """Test that log entries in each file match the expected user."""
         verifier = AccessLogVerifier()
-        today = datetime.now().strftime("%Y%m%d")
         
-        for email in AccessLogVerifier.EXPECTED_CLIENTS:
-            print(f"\nVerifying user field for {email}...")
-            
-            filename = f"access_{today}.log"
-            entries = verifier.read_log_file(email, filename)
-            
-            mismatched_entries = []
-            for i, entry in enumerate(entries):
-                if entry.get("user") != email:
-                    mismatched_entries.append((i, entry.get("user"), entry))
-            
-            if mismatched_entries:
-                for idx, found_user, entry in mismatched_entries[:3]:
-                    print(f"  Entry {idx} has wrong user: expected '{email}', found '{found_user}'")
-                
-                assert False, f"Found {len(mismatched_entries)} entries with wrong user for {email}"
+        print(f"\nVerifying user field for {email}...")
+        
+        filename = f"access_{today}.log"
+        entries = verifier.read_log_file(email, filename)
+        
+        mismatched_entries = []
+        for i, entry in enumerate(entries):
+            if entry.get("user") != email:
+                mismatched_entries.append((i, entry.get("user"), entry))
+        
+        if mismatched_entries:
+            for idx, found_user, entry in mismatched_entries[:3]:
+                print(f"  Entry {idx} has wrong user: expected '{email}', found '{found_user}'")
             
-            print(f"✓ All entries have correct user for {email}")
+            assert False, f"Found {len(mismatched_entries)} entries with wrong user for {email}"
+        
+        print(f"✓ All entries have correct user for {email}")
     
-    def test_log_entries_contain_expected_operations(self):
+    def test_log_entries_contain_expected_operations(self, email: str, today: str):
         """Test that logs contain expected operations from integration tests."""
         verifier = AccessLogVerifier()
-        today = datetime.now().strftime("%Y%m%d")
         
-        for email in AccessLogVerifier.EXPECTED_CLIENTS:
-            print(f"\nAnalyzing operations for {email}...")
-            
-            filename = f"access_{today}.log"
-            entries = verifier.read_log_file(email, filename)
-            
-            stats = verifier.get_log_statistics(entries)
-            
-            print(f"  Total entries: {stats['total_entries']}")
-            print(f"  Allowed: {stats['allowed_count']}, Denied: {stats['denied_count']}")
-            print(f"  Methods: {stats['methods']}")
-            print(f"  Access types: {stats['access_types']}")
-            print(f"  Unique paths: {stats['unique_paths_count']}")
-            print(f"  Status codes: {stats['status_codes']}")
-            
-            # Basic assertions
-            assert stats['total_entries'] > 0, f"No entries found for {email}"
-            
-            # Should have some write operations from file sync
-            if 'write' in stats['access_types']:
-                assert stats['access_types']['write'] > 0, f"No write operations logged for {email}"
-            
-            # Should have successful operations (200 status)
-            if '200' in stats['status_codes']:
-                assert stats['status_codes']['200'] > 0, f"No successful operations logged for {email}"
-            
-            print(f"✓ Operations logged correctly for {email}")
+        print(f"\nAnalyzing operations for {email}...")
+        
+        filename = f"access_{today}.log"
+        stats = verifier.log_file_statistics(email, filename)
+        
+        print(f"  Total entries: {stats['total_entries']}")
+        print(f"  Allowed: {stats['allowed_count']}, Denied: {stats['denied_count']}")
+        print(f"  Methods: {stats['methods']}")
+        print(f"  Access types: {stats['access_types']}")
+        print(f"  Unique paths: {stats['unique_paths_count']}")
+        print(f"  Status codes: {stats['status_codes']}")
+        
+        # Basic assertions
+        assert stats['total_entries'] > 0, f"No entries found for {email}"
+        
+        # Should have some write operations from file sync
+        if 'write' in stats['access_types']:
+            assert stats['access_types']['write'] > 0, f"No write operations logged for {email}"
+        
+        # Should have successful operations (200 status)
+        if '200' in stats['status_codes']:
+            assert stats['status_codes']['200'] > 0, f"No successful operations logged for {email}"
+        
+        print(f"✓ Operations logged correctly for {email}")
     
-    def test_log_entries_chronological_order(self):
+    def test_log_entries_chronological_order(self, email: str, today: str):
         """Test that log entries are in chronological order."""
         verifier = AccessLogVerifier()
-        today = datetime.now().strftime("%Y%m%d")
         
-        for email in AccessLogVerifier.EXPECTED_CLIENTS:
-            print(f"\nChecking chronological order for {email}...")
-            
-            filename = f"access_{today}.log"
-            entries = verifier.read_log_file(email, filename)
-            
-            if len(entries) < 2:
-                print(f"  Skipping order check for {email} (only {len(entries)} entries)")
-                continue
-            
-            out_of_order = []
-            for i in range(1, len(entries)):
-                prev_time = entries[i-1].get("timestamp", "")
-                curr_time = entries[i].get("timestamp", "")
-                
-                # Simple string comparison works for the format "YYYY-MM-DD HH:MM:SS.mmm UTC"
-                if curr_time < prev_time:
-                    out_of_order.append((i-1, i, prev_time, curr_time))
-            
-            if out_of_order:
-                for prev_idx, curr_idx, prev_time, curr_time in out_of_order[:3]:
-                    print(f"  Out of order: entry {prev_idx} ({prev_time}) > entry {curr_idx} ({curr_time})")
-                
-                # This is a warning, not a failure - logs might be written async
-                print(f"  ⚠ Found {len(out_of_order)} out-of-order entries (may be due to async writes)")
-            else:
-                print(f"✓ All entries in chronological order for {email}")
+        print(f"\nChecking chronological order for {email}...")
+        
+        filename = f"access_{today}.log"
+        entries = verifier.read_log_file(email, filename)
+        
+        if len(entries) < 2:
+            print(f"  Skipping order check for {email} (only {len(entries)} entries)")
+            return
+        
+        # Simple string comparison works for the format "YYYY-MM-DD HH:MM:SS.mmm UTC"
+        timestamps = [e.get("timestamp", "") for e in entries]
+        out_of_order = [
+            (i, i + 1, prev_time, curr_time)
+            for i, (prev_time, curr_time) in enumerate(pairwise(timestamps))
+            if curr_time < prev_time
+        ]
+        
+        if out_of_order:
+            for prev_idx, curr_idx, prev_time, curr_time in out_of_order[:3]:
+                print(f"  Out of order: entry {prev_idx} ({prev_time}) > entry {curr_idx} ({curr_time})")
+            
+            # This is a warning, not a failure - logs might be written async
+            print(f"  ⚠ Found {len(out_of_order)} out-of-order entries (may be due to async writes)")
+        else:
+            print(f"✓ All entries in chronological order for {email}")
     
-    def test_access_denied_entries(self):
+    def test_access_denied_entries(self, email: str, today: str):
         """Test that denied access attempts are properly logged if any occurred."""
         verifier = AccessLogVerifier()
-        today = datetime.now().strftime("%Y%m%d")
         
-        total_denied = 0
-        for email in AccessLogVerifier.EXPECTED_CLIENTS:
-            print(f"\nChecking for denied access entries for {email}...")
-            
-            filename = f"access_{today}.log"
-            entries = verifier.read_log_file(email, filename)
-            
-            denied_entries = [e for e in entries if not e.get("allowed", True)]
-            
-            if denied_entries:
-                total_denied += len(denied_entries)
-                print(f"  Found {len(denied_entries)} denied entries for {email}:")
-                
-                for entry in denied_entries[:3]:  # Show first 3
-                    print(f"    Path: {entry.get('path')}")
-                    print(f"    Reason: {entry.get('denied_reason', 'No reason provided')}")
-                    print(f"    Status: {entry.get('status_code')}")
-                
-                # Check that denied entries have appropriate status codes (403, 401, etc.)
-                for entry in denied_entries:
-                    status = entry.get("status_code", 0)
-                    assert status >= 400, f"Denied entry has success status code: {status}"
-            else:
-                print(f"  No denied entries for {email} (all access was allowed)")
+        print(f"\nChecking for denied access entries for {email}...")
         
-        print(f"\n✓ Total denied entries across all clients: {total_denied}")
+        filename = f"access_{today}.log"
+        entries = verifier.read_log_file(email, filename)
+        
+        denied_entries = [e for e in entries if not e.get("allowed", True)]
+        
+        if denied_entries:
+            print(f"  Found {len(denied_entries)} denied entries for {email}:")
+            
+            for entry in denied_entries[:3]:  # Show first 3
+                print(f"    Path: {entry.get('path')}")
+                print(f"    Reason: {entry.get('denied_reason', 'No reason provided')}")
+                print(f"    Status: {entry.get('status_code')}")
+            
+            # Check that denied entries have appropriate status codes (403, 401, etc.)
+            for entry in denied_entries:
+                status = entry.get("status_code", 0)
+                assert status >= 400, f"Denied entry has success status code: {status}"
+        else:
+            print(f"  No denied entries for {email} (all access was allowed)")
     
-    def test_log_rotation_if_applicable(self):
+    def test_log_rotation_if_applicable(self, email: str):
         """Test log rotation if files exceed size limits."""
         verifier = AccessLogVerifier()
         
-        for email in AccessLogVerifier.EXPECTED_CLIENTS:
-            print(f"\nChecking for log rotation for {email}...")
-            
-            files = verifier.list_log_files(email)
-            
-            # Check for rotated files (e.g., access_20240904.log.1)
-            rotated_files = [f for f in files if '.log.' in f]
-            
-            if rotated_files:
-                print(f"  Found rotated files for {email}: {rotated_files}")
+        print(f"\nChecking for log rotation for {email}...")
+        
+        files = verifier.list_log_files(email)
+        
+        # Check for rotated files (e.g., access_20240904.log.1)
+        rotated_files = [f for f in files if '.log.' in f]
+        
+        if rotated_files:
+            print(f"  Found rotated files for {email}: {rotated_files}")
+            
+            # Verify rotated files are also valid. They are historical and can be large, so
+            # only the first line is read rather than the whole file.
+            for filename in rotated_files[:1]:  # Check first rotated file
+                first_line = verifier.read_first_line(email, filename)
+                assert first_line is not None, f"Could not read rotated file {filename}"
+                assert first_line.strip(), f"Rotated file {filename} is empty"
                 
-                # Verify rotated files are also valid
-                for filename in rotated_files[:1]:  # Check first rotated file
-                    entries = verifier.read_log_file(email, filename)
-                    assert len(entries) > 0, f"Rotated file {filename} is empty"
-                    
-                    # Validate structure of first entry
-                    if entries:
-                        valid, message = verifier.verify_log_entry_structure(entries[0])
-                        assert valid, f"Rotated file has invalid entries: {message}"
+                try:
+                    first_entry = json_loads(first_line)
+                except ValueError:
+                    pytest.fail(f"First line of rotated file {filename} is not valid JSON: {first_line[:200]!r}")
                 
-                print(f"✓ Log rotation working correctly for {email}")
-            else:
-                print(f"  No log rotation needed for {email} (file size within limits)")
+                # Validate structure of first entry
+                valid, message = verifier.verify_log_entry_structure(first_entry)
+                assert valid, f"Rotated file has invalid entries: {message}"
+            
+            print(f"✓ Log rotation working correctly for {email}")
+        else:
+            print(f"  No log rotation needed for {email} (file size within limits)")
     
-    def test_summary_report(self):
+    def test_summary_report(self, today: str):
         """Generate a summary report of all access logs."""
         verifier = AccessLogVerifier()
-        today = datetime.now().strftime("%Y%m%d")
         
         print("\n" + "="*60)
         print("ACCESS LOG SUMMARY REPORT")
@@ -394,14 +579,12 @@ class TestAccessLoggingVerification:
             print("-" * 40)
             
             filename = f"access_{today}.log"
-            entries = verifier.read_log_file(email, filename)
+            stats = verifier.log_file_statistics(email, filename)
             
-            if not entries:
+            if not stats["total_entries"]:
                 print("  No entries found")
                 continue
             
-            stats = verifier.get_log_statistics(entries)
-            
             # Update totals
             total_stats["total_entries"] += stats["total_entries"]
             total_stats["total_allowed"] += stats["allowed_count"]